@@ -2,6 +2,8 @@
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from importlib.metadata import version
 from pathlib import Path
 
@@ -10,7 +12,7 @@ from loguru import logger as log
 
 from media_archive.config import debug_fmt, short_fmt
 from media_archive.deduplicate import collect_files, delete_duplicates, find_duplicates
-from media_archive.organizer import group_by_events, process_file
+from media_archive.organizer import extract_date_only, group_by_events, init_date_worker, process_file
 
 LOG_FILE = Path(__file__).resolve().parents[1] / "logs/media_archive_tools.log"
 LOG_FILE_RELATIVE = os.path.relpath(LOG_FILE.resolve(), start=Path.cwd())
@@ -56,13 +58,13 @@ def mat(ctx: click.Context, debug: bool, show_version: bool, logfile_enabled: bo
 
     log.remove()
     if debug:
-        log.add(sys.stderr, level=level, format=debug_fmt)
+        log.add(sys.stderr, level=level, format=debug_fmt, enqueue=True)
         if logfile_enabled:
-            log.add(LOG_FILE, rotation="10 MB", retention="7 days", level=level, format=debug_fmt)
+            log.add(LOG_FILE, rotation="10 MB", retention="7 days", level=level, format=debug_fmt, enqueue=True)
     else:
-        log.add(sys.stderr, level=level, format=short_fmt)
+        log.add(sys.stderr, level=level, format=short_fmt, enqueue=True)
         if logfile_enabled:
-            log.add(LOG_FILE, rotation="10 MB", retention="7 days", level=level, format=short_fmt)
+            log.add(LOG_FILE, rotation="10 MB", retention="7 days", level=level, format=short_fmt, enqueue=True)
 
     log.info("Welcome to Media Archive Tools")
 
@@ -84,28 +86,63 @@ def mat(ctx: click.Context, debug: bool, show_version: bool, logfile_enabled: bo
 )
 @click.option("--dry-run/--no-dry-run", default=False, help="If set, only print actions without moving files.")
 @click.option("--sort-events/--no-sort-events", default=False, help="If set, sort events.")
+@click.option(
+    "--max-concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of files processed concurrently.",
+)
 @click.pass_context
-def organize(ctx, source_folder: Path, target_folder: Path, dry_run: bool, sort_events: bool):
+def organize(ctx, source_folder: Path, target_folder: Path, dry_run: bool, sort_events: bool, max_concurrency: int):
     """Organize media files from source to target folder."""
     counter: int = 0
     counter_skipped: int = 0
     log.info(f"Started organizing new media {'(dry_run)' if dry_run else ''}...")
-    for item in source_folder.iterdir():
-        if item.is_file():
-            file_moved: bool = process_file(item, target_folder, log=log)
+    # Entries come from os.scandir so the file type is known without a stat, and each file is stat-ed only once
+    paths: list[Path] = []
+    stats: list[os.stat_result] = []
+    with os.scandir(source_folder) as it:
+        for entry in it:
+            if entry.is_file():
+                paths.append(Path(entry.path))
+                stats.append(entry.stat())
+
+    with ExitStack() as stack:
+        if max_concurrency == 1:
+            results = (process_file(path, target_folder, log=log, st=st) for path, st in zip(paths, stats))
+        else:
+            # Reading dates (EXIF parsing holds the GIL, ffprobe calls wait on a subprocess) runs in max_concurrency
+            # worker processes, so that many ffprobe calls are still in flight even above the number of CPUs.
+            # Moving files is I/O bound: it runs in a thread pool, as the dates come in.
+            processes = stack.enter_context(
+                ProcessPoolExecutor(max_workers=max_concurrency, initializer=init_date_worker, initargs=(log,))
+            )
+            threads = stack.enter_context(ThreadPoolExecutor(max_workers=max_concurrency))
+            # About 4 chunks per worker: few round trips on large folders, all workers busy on small ones
+            chunksize = max(1, len(paths) // (4 * max_concurrency))
+            dates = processes.map(extract_date_only, paths, stats, chunksize=chunksize)
+            futures = [
+                threads.submit(process_file, path, target_folder, log=log, file_date=file_date, st=st)
+                for (path, file_date), st in zip(dates, stats)
+            ]
+            results = (future.result() for future in as_completed(futures))
+
+        for file_moved in results:
             if file_moved:
                 counter += 1
+                if counter % 100 == 0:
+                    log.info("---- So far Processed {} files", counter)
             else:
                 counter_skipped += 1
-            if counter % 100 == 0:
-                log.info(f"---- So far Processed {counter} files")
 
     log.info(f"Finished moving media files. Files moved: {counter}; skipped: {counter_skipped}")
 
     if sort_events:
         log.info(f"Started organizing new media {'(dry_run)' if dry_run else ''}...")
         # Use events.yaml from the root directory of the package
-        group_by_events(target_folder, events_file, dry_run=dry_run, log=log)
+        group_by_events(target_folder, events_file, dry_run=dry_run, log=log, max_concurrency=max_concurrency)
 
 
 # Events
@@ -117,12 +154,27 @@ def organize(ctx, source_folder: Path, target_folder: Path, dry_run: bool, sort_
     required=True,
     help="Root folder containing year/month subfolders with media files",
 )
+@click.option(
+    "--events-file",
+    "-ef",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True, path_type=Path),
+    default=events_file,
+    help="YAML file with the events definitions",
+)
 @click.option("--dry-run/--no-dry-run", default=False, help="If set, only print actions without moving files.")
+@click.option(
+    "--max-concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of files of a month folder processed concurrently.",
+)
 @click.pass_context
-def events(ctx, target_folder: Path, events_file: Path, dry_run: bool):
+def events(ctx, target_folder: Path, events_file: Path, dry_run: bool, max_concurrency: int):
     """Group media files in the target folder by events from a YAML file."""
     log.info(f"Started organizing new media {'(dry_run)' if dry_run else ''}...")
-    group_by_events(target_folder, events_file, dry_run=dry_run, log=log)
+    group_by_events(target_folder, events_file, dry_run=dry_run, log=log, max_concurrency=max_concurrency)
 
 
 # Deduplicate
@@ -140,11 +192,11 @@ def events(ctx, target_folder: Path, events_file: Path, dry_run: bool):
 def deduplicate(target_folder: Path, dry_run: bool):
     """Deduplicate repeated images in the target folder."""
     log.info("📂 Scanning files...")
-    files = collect_files(path=target_folder)
-    log.info(f"📸 Found {len(files)} media files in {target_folder}")
+    paths, sizes = collect_files(path=target_folder)
+    log.info(f"📸 Found {len(paths)} media files in {target_folder}")
 
     log.info("🔍 Finding duplicates...")
-    duplicates = find_duplicates(files, log=log)
+    duplicates = find_duplicates(paths, sizes, log=log)
     log.info(f"🧬 Found {len(duplicates)} duplicate groups")
 
     delete_duplicates(duplicates, is_dry_run=dry_run, log=log)
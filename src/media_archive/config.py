@@ -1,8 +1,8 @@
 """Configuration variables."""
 
 # Supported extensions
-PHOTO_EXTS = {".jpg", ".jpeg", ".png", ".heic", ".tiff", ".dng"}
-VIDEO_EXTS = {".mp4", ".mov", ".avi", ".mkv"}
+PHOTO_EXTS = frozenset({".jpg", ".jpeg", ".png", ".heic", ".tiff", ".dng"})
+VIDEO_EXTS = frozenset({".mp4", ".mov", ".avi", ".mkv"})
 
 # Log formats
 short_fmt = "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <5}</level> - <level>{message}</level>"
@@ -2,22 +2,28 @@
 # TODO: Deduplicate videos too
 
 import hashlib
+import os
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, FrozenSet, Iterator, List, Tuple
 
 from media_archive.config import PHOTO_EXTS
 
+# Bytes read from each end of a file for the partial (pre-filter) hash
+PARTIAL_HASH_BYTES = 64 * 1024
 
-def file_hash(path: Path, chunk_size: int = 1024 * 1024) -> str:
+
+def file_hash(path: str | Path, chunk_size: int = 1024 * 1024) -> str:
     """Compute SHA-256 hash of a file (streamed).
 
     Parameters
     ----------
-    path : Path
+    path : str | Path
         Path to the file to hash.
     chunk_size : int, optional
-        Size of chunks to read at a time (default is 1MB).
+        Size of the chunks read and hashed at a time (default is 1MB).
 
     Returns
     -------
@@ -25,16 +31,114 @@ def file_hash(path: Path, chunk_size: int = 1024 * 1024) -> str:
         SHA-256 hash of the file as a hex string.
 
     """
-    # Compute SHA-256 hash of a file (streamed)."""
+    # SHA-256 is hardware accelerated (SHA-NI / ARMv8 SHA2) by OpenSSL, so the hash itself is cheap;
+    # read into a single reusable buffer to avoid allocating a new bytes object per chunk.
+    # The file is read rather than memory-mapped: a mapped file shrinking or failing to read while it is hashed
+    # (e.g. on a NAS mount) raises SIGBUS, which would kill the worker process instead of raising an OSError.
+    h = hashlib.sha256()
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    fadvise = hasattr(os, "posix_fadvise")
+    with open(path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        if fadvise:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        offset = 0
+        while n := f.readinto(buf):
+            offset += n
+            if fadvise:
+                # Start reading the next chunk in the background while this one is hashed
+                os.posix_fadvise(fd, offset, chunk_size, os.POSIX_FADV_WILLNEED)
+            h.update(view[:n])
+        if fadvise:
+            # The file will not be read again: drop its pages so that hashing a large archive does not evict the
+            # rest of the page cache
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    return h.hexdigest()
+
+
+def partial_hash(path: str | Path, n: int = PARTIAL_HASH_BYTES) -> str:
+    """Compute SHA-256 hash of the first and last `n` bytes of a file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the file to hash.
+    n : int, optional
+        Number of bytes to read from each end of the file (default is 64KB).
+
+    Returns
+    -------
+    str
+        SHA-256 hash of the head and tail of the file as a hex string.
+
+    """
     h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        h.update(os.pread(fd, n, 0))
+        if size > n:
+            h.update(os.pread(fd, n, max(n, size - n)))
+    finally:
+        os.close(fd)
     return h.hexdigest()
 
 
-def collect_files(path: Path, type: str = "photo") -> List[Path]:
-    """Return list of files of type photo/video.
+def _safe_hash(hash_func: Callable[[str], str], path: str) -> Tuple[str, str | None, Exception | None]:
+    """Hash a file without raising, so it can be safely mapped over a process pool.
+
+    Parameters
+    ----------
+    hash_func : Callable[[str], str]
+        Hash function to apply (`file_hash` or `partial_hash`).
+    path : str
+        Path to the file to hash.
+
+    Returns
+    -------
+    Tuple[str, str | None, Exception | None]
+        The path, its hash (None on failure) and the exception raised while hashing (if any).
+
+    """
+    try:
+        return path, hash_func(path), None
+    except Exception as e:
+        return path, None, e
+
+
+def _scan_files(path: str | Path, extensions: FrozenSet[str]) -> Iterator[Tuple[str, int]]:
+    """Walk a directory tree and yield path and size of the files with the given extensions.
+
+    The tree is walked iteratively with an explicit stack of pending directories: only one directory handle is
+    open at a time and deeply nested trees do not go through one nested generator per level.
+
+    Parameters
+    ----------
+    path : str | Path
+        Directory to scan.
+    extensions : FrozenSet[str]
+        Lowercase file extensions (with dot) to yield.
+
+    Yields
+    ------
+    Tuple[str, int]
+        File path and size in bytes, taken from the `os.DirEntry` so files are stat-ed only once.
+
+    """
+    splitext = os.path.splitext
+    pending = [os.fspath(path)]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file() and splitext(entry.name)[1].lower() in extensions:
+                    yield entry.path, entry.stat().st_size
+
+
+def collect_files(path: Path, type: str = "photo") -> Tuple[List[str], List[int]]:
+    """Return files of type photo/video along with their size.
 
     Parameters
     ----------
@@ -45,32 +149,42 @@ def collect_files(path: Path, type: str = "photo") -> List[Path]:
 
     Returns
     -------
-    List[Path]
-        List of file paths matching the type.
+    Tuple[List[str], List[int]]
+        Parallel lists with the path and the size in bytes of each file matching the type.
 
     """
     # Return list of files of type photo/video."""
-    extensions = set()
+    extensions: FrozenSet[str] = frozenset()
     if type == "photo":
         extensions = PHOTO_EXTS
     elif type == "video":
         raise NotImplementedError("Video is not supported yet")
 
-    files = []
-    for p in path.rglob("*"):
-        if p.is_file() and p.suffix.lower() in extensions:
-            files.append(p)
+    paths: List[str] = []
+    sizes: List[int] = []
+    for file_path, size in _scan_files(path, extensions):
+        paths.append(file_path)
+        sizes.append(size)
+
+    return paths, sizes
+
 
-    return files
+def find_duplicates(paths: List[str], sizes: List[int], log: None) -> Dict[str, List[Path]]:
+    """Find duplicate files by grouping by size, then by partial hash and finally by full hash.
 
+    Each tier only forwards the files that still collide, so most same-size but different files are told
+    apart by reading their first and last `PARTIAL_HASH_BYTES` instead of their whole content:
 
-def find_duplicates(files: List[Path], log: None) -> Dict[str, List[Path]]:
-    """Find duplicate files by grouping by size and then by hash.
+    1. size: files with a unique size cannot have a duplicate.
+    2. partial hash: hash of the head and tail of the file (skipped for files small enough to be fully read).
+    3. full hash: SHA-256 of the whole file.
 
     Parameters
     ----------
-    files : List[Path]
-        List of file paths to check for duplicates.
+    paths : List[str]
+        File paths to check for duplicates (as returned by `collect_files`).
+    sizes : List[int]
+        Size in bytes of each file in `paths` (as returned by `collect_files`).
     log : log, optional
         log to use for logging errors.
 
@@ -80,26 +194,44 @@ def find_duplicates(files: List[Path], log: None) -> Dict[str, List[Path]]:
         Dictionary mapping hash to list of duplicate file paths.
 
     """
-    # 1️⃣ Group by size
+    # 1️⃣ Group by size: sizes are counted first (in C), so groups are only built for the repeated sizes
+    size_counts = Counter(sizes)
     size_groups = defaultdict(list)
-    for f in files:
-        size_groups[f.stat().st_size].append(f)
-
-    # 2️⃣ Hash only same-size files
-    hash_groups = defaultdict(list)
-    for size, group in size_groups.items():
-        if len(group) < 2:
-            continue
-        for f in group:
-            try:
-                h = file_hash(f)
+    for f, size in zip(paths, sizes):
+        if size_counts[size] > 1:
+            size_groups[size].append(f)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # 2️⃣ Partial hash of same-size files (small files go straight to the full hash)
+        candidates = []
+        partial_candidates = []
+        partial_sizes = []
+        for size, group in size_groups.items():
+            if size <= 2 * PARTIAL_HASH_BYTES:
+                candidates.extend(group)
+            else:
+                partial_candidates.extend(group)
+                partial_sizes.extend(repeat(size, len(group)))
+
+        partial_groups = defaultdict(list)
+        partial_results = executor.map(_safe_hash, repeat(partial_hash), partial_candidates, chunksize=8)
+        for size, (f, h, e) in zip(partial_sizes, partial_results):
+            if h is not None:
+                partial_groups[(size, h)].append(f)
+            elif log:
+                log.error("⚠️ Error hashing {}: {}", f, e)
+        candidates.extend(f for group in partial_groups.values() if len(group) > 1 for f in group)
+
+        # 3️⃣ Full hash of files whose partial hash collides, spreading the hashing across processes
+        hash_groups = defaultdict(list)
+        for f, h, e in executor.map(_safe_hash, repeat(file_hash), candidates, chunksize=8):
+            if h is not None:
                 hash_groups[h].append(f)
-            except Exception as e:
-                if log:
-                    log.error(f"⚠️ Error hashing {f}: {e}")
+            elif log:
+                log.error("⚠️ Error hashing {}: {}", f, e)
 
-    # 3️⃣ Keep only real duplicates
-    duplicates = {h: files for h, files in hash_groups.items() if len(files) > 1}
+    # 4️⃣ Keep only real duplicates
+    duplicates = {h: [Path(f) for f in files] for h, files in hash_groups.items() if len(files) > 1}
 
     return duplicates
 
@@ -167,10 +299,11 @@ def delete_duplicates(duplicates: Dict[str, List[Path]], log, is_dry_run: bool =
         stems = [f.stem for f in files]
         # Remove trailing underscores for comparison
         stems_clean = [s.rstrip("_") for s in stems]
-        # Most common stem is likely the original
-
-        stem_counter = Counter(stems_clean)
-        original_stem = stem_counter.most_common(1)[0][0]
+        # Most common stem is likely the original (first one seen on ties)
+        stem_counts: Dict[str, int] = {}
+        for stem in stems_clean:
+            stem_counts[stem] = stem_counts.get(stem, 0) + 1
+        original_stem = max(stem_counts, key=stem_counts.__getitem__)
         ext = files[0].suffix.lstrip(".")
 
         # Prefer to keep the file that matches the original stem and not a copy variant
@@ -185,16 +318,16 @@ def delete_duplicates(duplicates: Dict[str, List[Path]], log, is_dry_run: bool =
 
         remove = [f for f in files if f != keep]
 
-        log.info(f"🟢 Keeping: {keep}")
+        log.info("🟢 Keeping: {}", keep)
         for f in remove:
             if is_dry_run:
-                log.info(f"🧪 Would delete: {f}")
+                log.info("🧪 Would delete: {}", f)
             else:
                 try:
                     f.unlink()
-                    log.info(f"❌ Deleted: {f}")
+                    log.info("❌ Deleted: {}", f)
                     total_deleted += 1
                 except Exception as e:
-                    log.error(f"⚠️ Failed to delete {f}: {e}")
+                    log.error("⚠️ Failed to delete {}: {}", f, e)
 
     log.info(f"✅ Total duplicates removed: {total_deleted}")
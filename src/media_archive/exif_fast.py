@@ -0,0 +1,150 @@
+"""Fast EXIF date reader for JPEG files."""
+
+import datetime
+import mmap
+import os
+import struct
+from pathlib import Path
+
+# Bytes of the file mapped to look for the EXIF segment (an APP1 segment is at most 64KB long)
+HEADER_SIZE = 64 * 1024
+
+TAG_DATETIME = 0x0132
+TAG_EXIF_IFD = 0x8769
+TAG_DATETIME_ORIGINAL = 0x9003
+TAG_DATETIME_DIGITIZED = 0x9004
+
+
+def _read_ifd(buf: mmap.mmap, tiff: int, offset: int, endian: str, tags: tuple[int, ...]) -> dict[int, int]:
+    """Return the value/offset field of the requested tags found in an IFD.
+
+    Parameters
+    ----------
+    buf : mmap.mmap
+        Mapped file header.
+    tiff : int
+        Position of the TIFF header in `buf` (IFD offsets are relative to it).
+    offset : int
+        Offset of the IFD from the TIFF header.
+    endian : str
+        `struct` byte order character of the TIFF data ('<' or '>').
+    tags : tuple[int, ...]
+        Tags to look for.
+
+    Returns
+    -------
+    dict[int, int]
+        Dictionary mapping each found tag to its 4-byte value/offset field.
+
+    """
+    start = tiff + offset
+    (count,) = struct.unpack_from(endian + "H", buf, start)
+    found = {}
+    for entry in range(start + 2, start + 2 + 12 * count, 12):
+        tag, _type, _count, value = struct.unpack_from(endian + "HHII", buf, entry)
+        if tag in tags:
+            found[tag] = value
+    return found
+
+
+def parse_exif_datetime(value: str | bytes) -> datetime.datetime | None:
+    """Parse an EXIF 'YYYY:MM:DD HH:MM:SS' timestamp by position, avoiding `datetime.strptime`.
+
+    Parameters
+    ----------
+    value : str | bytes
+        EXIF timestamp (raw ASCII bytes are parsed without being decoded).
+
+    Returns
+    -------
+    datetime.datetime
+        If the timestamp is valid else None (e.g. blank '    :  :     :  :  ' timestamps).
+
+    """
+    try:
+        return datetime.datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]), int(value[14:16]), int(value[17:19])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+def _parse_datetime(buf: mmap.mmap, tiff: int, offset: int) -> datetime.datetime | None:
+    """Parse the 19 characters EXIF timestamp stored at `offset` from the TIFF header."""
+    return parse_exif_datetime(buf[tiff + offset : tiff + offset + 19])
+
+
+def _find_exif(buf: mmap.mmap) -> int | None:
+    """Return the position of the TIFF header of the EXIF (APP1) segment of a JPEG file if found else None."""
+    if buf[:2] != b"\xff\xd8":
+        return None
+    pos = 2
+    while pos + 4 <= len(buf):
+        if buf[pos] != 0xFF:
+            return None
+        marker = buf[pos + 1]
+        if marker in (0xD9, 0xDA):
+            # End of image / start of scan: no more metadata segments
+            return None
+        (length,) = struct.unpack_from(">H", buf, pos + 2)
+        if marker == 0xE1 and buf[pos + 4 : pos + 10] == b"Exif\x00\x00":
+            return pos + 10
+        pos += 2 + length
+    return None
+
+
+def read_datetime_original(path: Path) -> datetime.datetime | None:
+    """Read the capture date of a JPEG file from its EXIF metadata.
+
+    Only the first `HEADER_SIZE` bytes of the file are mapped: the EXIF (APP1) segment is located by skipping over
+    the preceding segments, then only IFD0 and the EXIF sub-IFD entries are walked, looking for the
+    DateTimeOriginal (0x9003), DateTimeDigitized (0x9004) and DateTime (0x0132) tags, in that order of preference.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the JPEG file.
+
+    Returns
+    -------
+    datetime.datetime
+        If datetime could be extracted else None (also for non-JPEG files or EXIF data beyond the mapped header).
+
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None
+        with mmap.mmap(f.fileno(), min(size, HEADER_SIZE), access=mmap.ACCESS_READ) as buf:
+            try:
+                tiff = _find_exif(buf)
+                if tiff is None:
+                    return None
+
+                byte_order = buf[tiff : tiff + 2]
+                if byte_order == b"II":
+                    endian = "<"
+                elif byte_order == b"MM":
+                    endian = ">"
+                else:
+                    return None
+                magic, ifd0 = struct.unpack_from(endian + "HI", buf, tiff + 2)
+                if magic != 42:
+                    return None
+
+                tags = _read_ifd(buf, tiff, ifd0, endian, (TAG_DATETIME, TAG_EXIF_IFD))
+                if TAG_EXIF_IFD in tags:
+                    exif_tags = _read_ifd(
+                        buf, tiff, tags[TAG_EXIF_IFD], endian, (TAG_DATETIME_ORIGINAL, TAG_DATETIME_DIGITIZED)
+                    )
+                    tags.update(exif_tags)
+
+                for tag in (TAG_DATETIME_ORIGINAL, TAG_DATETIME_DIGITIZED, TAG_DATETIME):
+                    if tag in tags:
+                        dt = _parse_datetime(buf, tiff, tags[tag])
+                        if dt:
+                            return dt
+            except (struct.error, IndexError):
+                # Truncated or malformed EXIF data (or lying beyond the mapped header)
+                return None
+    return None
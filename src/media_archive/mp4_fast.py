@@ -0,0 +1,98 @@
+"""Fast creation date reader for MP4/MOV (ISO base media) files."""
+
+import datetime
+import os
+import struct
+from pathlib import Path
+
+# Containers whose creation date can be read from the movie header (mvhd) atom
+MP4_EXTS = frozenset({".mp4", ".mov"})
+
+# MP4/QuickTime timestamps are seconds since 1904-01-01 00:00:00 UTC
+MP4_EPOCH = datetime.datetime(1904, 1, 1)
+
+
+def _find_atom(f, atom_type: bytes, start: int, end: int) -> tuple[int, int] | None:
+    """Return the payload boundaries of the first atom of the given type between `start` and `end`.
+
+    Parameters
+    ----------
+    f : BinaryIO
+        File opened in binary mode.
+    atom_type : bytes
+        Four characters code of the atom to look for (e.g. b"moov").
+    start : int
+        Position of the first atom header to read.
+    end : int
+        Position of the end of the enclosing atom (or of the file).
+
+    Returns
+    -------
+    tuple[int, int]
+        Start and end positions of the atom payload if found else None.
+
+    """
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header_size = 8
+        if size == 1:
+            # 64-bit "largesize" follows the type (e.g. large mdat atoms)
+            (size,) = struct.unpack(">Q", f.read(8))
+            header_size = 16
+        elif size == 0:
+            # Atom extending to the end of the enclosing atom
+            size = end - pos
+        if size < header_size:
+            return None
+        if kind == atom_type:
+            return pos + header_size, pos + size
+        pos += size
+    return None
+
+
+def read_mvhd_creation_time(path: Path) -> datetime.datetime | None:
+    """Read the creation date of a MP4/MOV file from its movie header (moov/mvhd) atom.
+
+    Only atom headers are read while skipping over the top-level atoms (the media data is never read), so the date
+    is found in a few small reads wherever the moov atom is (before or after the media data).
+
+    Parameters
+    ----------
+    path : Path
+        Path to the video file.
+
+    Returns
+    -------
+    datetime.datetime
+        Creation date (UTC, naive) if it could be extracted else None (also when it is not set in the file).
+
+    """
+    with open(path, "rb", buffering=0) as f:
+        try:
+            moov = _find_atom(f, b"moov", 0, os.fstat(f.fileno()).st_size)
+            if moov is None:
+                return None
+            mvhd = _find_atom(f, b"mvhd", *moov)
+            if mvhd is None:
+                return None
+
+            f.seek(mvhd[0])
+            header = f.read(12)
+            # Version (1 byte) and flags (3 bytes), then a 32-bit (version 0) or 64-bit (version 1) creation time
+            if header[0] == 1:
+                (creation_time,) = struct.unpack_from(">Q", header, 4)
+            else:
+                (creation_time,) = struct.unpack_from(">I", header, 4)
+        except (struct.error, IndexError):
+            # Truncated or malformed file
+            return None
+
+    if not creation_time:
+        return None
+    try:
+        return MP4_EPOCH + datetime.timedelta(seconds=creation_time)
+    except OverflowError:
+        # Bogus 64-bit creation time beyond the datetime range
+        return None
@@ -1,21 +1,72 @@
 """Organize photos and videos."""
 
+import bisect
 import datetime
+import errno
+import itertools
+import os
 import re
 import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
-import ffmpeg
-from PIL import ExifTags, Image
+from PIL import Image
 
 from media_archive.config import PHOTO_EXTS, VIDEO_EXTS
+from media_archive.exif_fast import (
+    TAG_DATETIME,
+    TAG_DATETIME_DIGITIZED,
+    TAG_DATETIME_ORIGINAL,
+    parse_exif_datetime,
+    read_datetime_original,
+)
+from media_archive.mp4_fast import MP4_EXTS, read_mvhd_creation_time
 from media_archive.utils import load_events
 
-# Regex to extract YYYYMMDD
-DATE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})")
+# Regex to extract YYYYMMDD (ASCII digits only)
+DATE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})", re.ASCII)
+# Range of years accepted for dates inferred from filenames
+MIN_YEAR, MAX_YEAR = 1970, 2050
 
-EXIF_TAGS = {v: k for k, v in ExifTags.TAGS.items()}
+# ffprobe invocation printing only the container creation time (bare value, no JSON), without probing every stream
+FFPROBE_CMD = [
+    "ffprobe",
+    "-v",
+    "quiet",
+    "-select_streams",
+    "v:0",
+    "-show_entries",
+    "format_tags=creation_time",
+    "-of",
+    "default=nw=1:nk=1",
+]
+
+# Destination folders already created by this process, so each one is only created once
+_ENSURED: set[str] = set()
+
+# Dates read from file metadata, keyed on the file path and stored with the size and mtime_ns they were read at (an
+# entry is only used while both still match). Entries follow the files moved by this process, so grouping files by
+# events right after organizing them does not read their metadata again. Oldest entries are evicted first.
+_DATE_CACHE: dict[str, tuple[int, int, datetime.datetime]] = {}
+_DATE_CACHE_SIZE = 8192
+_DATE_CACHE_LOCK = threading.Lock()
+
+# Logger of the date extraction worker processes (set by `init_date_worker`)
+_WORKER_LOG = None
+
+# EXIF tags holding the capture date, by order of preference (DateTimeOriginal, DateTimeDigitized, DateTime)
+EXIF_DATE_TAG_IDS = (TAG_DATETIME_ORIGINAL, TAG_DATETIME_DIGITIZED, TAG_DATETIME)
+
+
+@lru_cache(maxsize=4096)
+def _ymd_strs(year: int, month: int, day: int) -> Tuple[str, str, str]:
+    """Return year, year-month, and day as strings (memoized: most files of a folder share a few dates)."""
+    return str(year), f"{year}{month:02d}", f"{day:02d}"
 
 
 def get_year_month_day(dt: datetime.datetime) -> Tuple[str, str, str]:
@@ -32,25 +83,7 @@ def get_year_month_day(dt: datetime.datetime) -> Tuple[str, str, str]:
         Year, year-month, and day as strings.
 
     """
-    return str(dt.year), f"{dt.year}{dt.month:02d}", f"{dt.day:02d}"
-
-
-def validate_ymd_date(year: int, month: int, day: int, min_year: int = 1970, max_year: int = 2050, log=None) -> bool:
-    """Validate year, month, and day are within allowed ranges."""
-    if year < min_year or year > max_year:
-        if log:
-            log.error(f"Parsed year is out of range!: '{year}' [min year: {min_year}; max year: {max_year}]")
-        return False
-    elif month < 1 or month > 12:
-        if log:
-            log.error(f"Parsed month is out of range!: {month}")
-        return False
-    elif day < 1 or day > 31:
-        if log:
-            log.error(f"Parsed day is out of range!: {day}")
-        return False
-
-    return True
+    return _ymd_strs(dt.year, dt.month, dt.day)
 
 
 def get_date_from_filename(path: Path, log: None) -> datetime.datetime | None:
@@ -69,19 +102,28 @@ def get_date_from_filename(path: Path, log: None) -> datetime.datetime | None:
         If datetime could be extracted else None.
 
     """
-    match = DATE_RE.search(path.name)
+    name = path.name
+    # A date needs at least 8 characters (YYYYMMDD): skip the regex for shorter names
+    if len(name) < 8:
+        return None
+    match = DATE_RE.search(name)
     if match:
         year, month, day = match.groups()
-        year_i, month_i, day_i = int(year), int(month), int(day)
-        if not validate_ymd_date(year_i, month_i, day_i, min_year=1970, max_year=2050, log=log):
+        try:
+            # The datetime constructor validates month and day ranges itself
+            dt = datetime.datetime(int(year), int(month), int(day))
+        except ValueError:
             if log:
-                log.error(f"Could not validate inferred date from name {path.name}")
+                log.error("Could not infer date from {}", path.name)
             return None
-        try:
-            return datetime.datetime(year_i, month_i, day_i)
-        except Exception:
+        if not MIN_YEAR <= dt.year <= MAX_YEAR:
             if log:
-                log.error(f"Could not infer date from {path.name}")
+                log.error(
+                    "Parsed year is out of range!: '{}' [min year: {}; max year: {}]", dt.year, MIN_YEAR, MAX_YEAR
+                )
+                log.error("Could not validate inferred date from name {}", path.name)
+            return None
+        return dt
     return None
 
 
@@ -102,21 +144,29 @@ def get_date_from_image_exif(path: Path, log=None) -> datetime.datetime | None:
 
     """
     try:
+        # JPEG fast path: only the EXIF date tags are read from the file header, without Pillow
+        dt = read_datetime_original(path)
+        if dt:
+            return dt
+
+        # Other formats (PNG, HEIC, TIFF...) or unusual JPEG layouts
         with Image.open(path) as img:
             exif = img.getexif()
             if exif:
-                for tag in ("DateTimeOriginal", "DateTimeDigitized", "DateTime"):
-                    tag_id = EXIF_TAGS.get(tag)
-                    if tag_id is not None and tag_id in exif:
-                        return datetime.datetime.strptime(exif[tag_id], "%Y:%m:%d %H:%M:%S")
+                for tag_id in EXIF_DATE_TAG_IDS:
+                    value = exif.get(tag_id)
+                    if value:
+                        dt = parse_exif_datetime(value)
+                        if dt:
+                            return dt
     except Exception:
         if log:
-            log.info(f"EXIF : {path}")
+            log.info("EXIF : {}", path)
     return None
 
 
 def get_date_from_video(path: Path, log=None) -> datetime.datetime | None:
-    """Extract datetime from video metadata using ffmpeg.
+    """Extract datetime from video metadata (MP4/MOV movie header, or ffprobe).
 
     Parameters
     ----------
@@ -132,18 +182,30 @@ def get_date_from_video(path: Path, log=None) -> datetime.datetime | None:
 
     """
     try:
-        probe = ffmpeg.probe(str(path))
-        tags = probe.get("format", {}).get("tags", {})
-        ct = tags.get("creation_time")
+        # MP4/MOV fast path: creation time read from the movie header atom, without spawning ffprobe
+        if path.suffix.lower() in MP4_EXTS:
+            dt = read_mvhd_creation_time(path)
+            if dt:
+                return dt
+
+        # Other containers (AVI, MKV...) or files without a usable movie header
+        ct = subprocess.run(FFPROBE_CMD + [str(path)], capture_output=True, text=True, timeout=10).stdout.strip()
         if ct:
             return datetime.datetime.fromisoformat(ct.replace("Z", ""))
     except Exception:
         if log:
-            log.info(f"VIDEO : {path}")
+            log.info("VIDEO : {}", path)
     return None
 
 
-def get_date_from_file(path: Path, log=None) -> datetime.datetime | None:
+# Metadata date reader of each supported extension
+_DATE_HANDLERS = {
+    **{ext: get_date_from_image_exif for ext in PHOTO_EXTS},
+    **{ext: get_date_from_video for ext in VIDEO_EXTS},
+}
+
+
+def get_date_from_file(path: Path, log=None, mtime: float | None = None) -> datetime.datetime | None:
     """Extract datetime from file's modification time.
 
     Parameters
@@ -152,6 +214,8 @@ def get_date_from_file(path: Path, log=None) -> datetime.datetime | None:
         Path to the file.
     log : Logger, optional
         Logger object.
+    mtime : float, optional
+        Modification time of the file, if already known by the caller (the file is stat-ed otherwise).
 
     Returns
     -------
@@ -160,14 +224,19 @@ def get_date_from_file(path: Path, log=None) -> datetime.datetime | None:
 
     """
     try:
-        return datetime.datetime.fromtimestamp(path.stat().st_mtime)
-    except Exception:
+        if mtime is None:
+            mtime = path.stat().st_mtime
+        return datetime.datetime.fromtimestamp(mtime)
+    except (OSError, OverflowError, ValueError):
+        # Missing/unreadable file, or a modification time out of the platform/datetime range
         if log:
-            log.info(f"Fallback : {path}")
+            log.info("Fallback : {}", path)
         return None
 
 
-def extract_date(path: Path, log=None) -> datetime.datetime | None:
+def extract_date(
+    path: Path, log=None, ext: str | None = None, st: os.stat_result | None = None
+) -> datetime.datetime | None:
     """Extract datetime from file using filename, EXIF, video metadata, or file date.
 
     Parameters
@@ -176,6 +245,10 @@ def extract_date(path: Path, log=None) -> datetime.datetime | None:
         Path to the file.
     log : Logger, optional
         Logger object.
+    ext : str, optional
+        Lowercase file extension, if already computed by the caller (taken from `path` otherwise).
+    st : os.stat_result, optional
+        Status of the file, if already known by the caller (the file is stat-ed otherwise).
 
     Returns
     -------
@@ -188,29 +261,167 @@ def extract_date(path: Path, log=None) -> datetime.datetime | None:
     if dt:
         return dt
 
-    # 2️⃣ Extract date from Photo EXIF
-    if path.suffix.lower() in PHOTO_EXTS:
-        dt = get_date_from_image_exif(path, log=log)
-        if dt:
-            return dt
+    # The file is stat-ed once, for both the cache key and the filesystem fallback
+    if st is None:
+        try:
+            st = path.stat()
+        except OSError:
+            if log:
+                log.info("Fallback : {}", path)
+            return None
+    cached = _DATE_CACHE.get(str(path))
+    if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+        return cached[2]
+
+    dt = _extract_date_from_metadata(path, log, path.suffix.lower() if ext is None else ext, st.st_mtime)
+    if dt:
+        _cache_date(path, st, dt)
+    return dt
+
 
-    # 3️⃣ Extract date from Video metadata
-    elif path.suffix.lower() in VIDEO_EXTS:
-        dt = get_date_from_video(path, log=log)
+def _cache_date(path: Path, st: os.stat_result, dt: datetime.datetime) -> None:
+    """Store the date of a file in the bounded `_DATE_CACHE`, evicting its oldest entry when full."""
+    with _DATE_CACHE_LOCK:
+        if len(_DATE_CACHE) >= _DATE_CACHE_SIZE:
+            del _DATE_CACHE[next(iter(_DATE_CACHE))]
+        _DATE_CACHE[str(path)] = (st.st_size, st.st_mtime_ns, dt)
+
+
+def _move_cached_date(src: Path, dst: Path) -> None:
+    """Re-key the cached date of a file moved from `src` to `dst` (moves keep the size and mtime of files)."""
+    with _DATE_CACHE_LOCK:
+        cached = _DATE_CACHE.pop(str(src), None)
+        if cached:
+            _DATE_CACHE[str(dst)] = cached
+
+
+def init_date_worker(log=None) -> None:
+    """Initialize a worker process running `extract_date_only`.
+
+    Parameters
+    ----------
+    log : Logger, optional
+        Logger object (loguru loggers can only be shared with other processes if their sinks use `enqueue=True`).
+
+    Returns
+    -------
+    None
+
+    """
+    global _WORKER_LOG
+    _WORKER_LOG = log
+
+
+def extract_date_only(path: Path, st: os.stat_result | None = None) -> Tuple[Path, datetime.datetime | None]:
+    """Extract the date of a media file without moving it, to be mapped over a process pool.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file.
+    st : os.stat_result, optional
+        Status of the file, if already known by the caller.
+
+    Returns
+    -------
+    Tuple[Path, datetime.datetime | None]
+        The path and its date (None for unknown file types or if no date could be extracted).
+
+    """
+    ext = path.suffix.lower()
+    if ext not in _DATE_HANDLERS:
+        return path, None
+    return path, extract_date(path, log=_WORKER_LOG, ext=ext, st=st)
+
+
+def _extract_date_from_metadata(path: Path, log, ext: str, mtime: float) -> datetime.datetime | None:
+    """Extract datetime from EXIF, video metadata, or file date (see `extract_date`)."""
+    # 2️⃣ Extract date from Photo EXIF / 3️⃣ Extract date from Video metadata
+    handler = _DATE_HANDLERS.get(ext)
+    if handler:
+        dt = handler(path, log=log)
         if dt:
             return dt
 
     # 4️⃣ Filesystem fallback - Extract date from creation date
-    dt = get_date_from_file(path, log=log)
+    dt = get_date_from_file(path, log=log, mtime=mtime)
     if dt:
         return dt
 
     return None
 
 
-def group_by_events(target_folder: Path, events_file: Path, dry_run: bool = True, log=None) -> None:
+def _ensure_dir(path: Path) -> None:
+    """Create a folder (and its parents) unless it was already created by this process.
+
+    Parameters
+    ----------
+    path : Path
+        Folder to create.
+
+    Returns
+    -------
+    None
+
+    """
+    # Concurrent callers may both create the folder: mkdir(exist_ok=True) is idempotent, so no lock is needed
+    key = str(path)
+    if key not in _ENSURED:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED.add(key)
+
+
+def _fast_move(src: Path, dst: Path) -> None:
+    """Move a file, copying it at kernel level when source and destination are on different devices.
+
+    Parameters
+    ----------
+    src : Path
+        Path to the file to move.
+    dst : Path
+        Destination path of the file.
+
+    Returns
+    -------
+    None
+
+    """
+    try:
+        os.rename(src, dst)
+        return
+    except FileNotFoundError:
+        if dst.parent.exists():
+            raise
+        # Destination folder removed since `_ensure_dir` created it (e.g. when organizing twice in one process after
+        # deleting the target tree): forget it, create it again and retry
+        _ENSURED.discard(str(dst.parent))
+        _ensure_dir(dst.parent)
+        _fast_move(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    # Cross-device move (e.g. to a NAS mount): copy the data, then the metadata, then remove the source.
+    # copyfile uses the platform zero-copy primitive (sendfile on Linux, fcopyfile on macOS) when available.
+    try:
+        shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+    except BaseException:
+        dst.unlink(missing_ok=True)
+        raise
+    os.unlink(src)
+
+
+def group_by_events(
+    target_folder: Path, events_file: Path, dry_run: bool = True, log=None, max_concurrency: int = 1
+) -> None:
     """Organize files in the target folder into event-based subfolders based on date ranges from an events file.
 
+    A file goes to the event covering its date. When events overlap (e.g. a wedding during the summer holidays),
+    it goes to the latest starting one among those covering its date, and to the last listed one in the events file
+    among those starting on the same day.
+
     Parameters
     ----------
     target_folder : Path
@@ -221,56 +432,88 @@ def group_by_events(target_folder: Path, events_file: Path, dry_run: bool = True
         If True, only print the actions that would be taken, do not move files (default is True).
     log : Logger, optional
         Logger object.
+    max_concurrency : int, optional
+        Maximum number of files of a month folder processed concurrently (default is 1).
 
     Returns
     -------
     None
 
     """
+    # Events are sorted by start date, to find the event of each file by binary search
     events = load_events(events_file)
+    starts = [event["start"] for event in events]
+    # Latest end date among the events starting up to each index: no earlier event can cover a date after it
+    max_ends = list(itertools.accumulate((event["end"] for event in events), max))
+    for event in events:
+        # Destination folder of each event, created on its first matching file
+        event["_dest"] = target_folder.joinpath(*event["root_parts"])
+        event["_dest_ready"] = False
     if log:
         log.info(f"loaded {len(events)} events from 'events.yaml' file...")
 
-    for year_dir in target_folder.iterdir():
-        if not year_dir.is_dir() or not year_dir.name.isdigit():
-            continue
-
-        for month_dir in year_dir.iterdir():
-            if not month_dir.is_dir() or not month_dir.name.isdigit():
-                continue
+    def group_file(path: Path) -> None:
+        date = extract_date(path, log=log)
+        if not date:
+            return
 
-            for path in month_dir.iterdir():
-                if not path.is_file():
-                    continue
+        # Latest event starting on or before the file date, walking back over the events that ended before it
+        # (possible with overlapping events) while an earlier one may still cover it (one event per file)
+        day = date.date()
+        i = bisect.bisect_right(starts, day) - 1
+        while i >= 0 and max_ends[i] >= day and events[i]["end"] < day:
+            i -= 1
+        if i < 0 or events[i]["end"] < day:
+            return
+        event = events[i]
 
-                date = extract_date(path, log=log)
-                if not date:
-                    continue
+        if not event["_dest_ready"]:
+            event["_dest"].mkdir(parents=True, exist_ok=True)
+            event["_dest_ready"] = True
 
-                for event in events:
-                    if event["start"] <= date.date() <= event["end"]:
-                        event_root = (
-                            target_folder / str(event["start"].year) / event["start"].strftime("%Y%m") / event["name"]
-                        )
-                        event_root.mkdir(parents=True, exist_ok=True)
+        dest = event["_dest"] / path.name
 
-                        dest = event_root / path.name
+        if dry_run:
+            if log:
+                log.info("🧪 Would move {} → {}", path, dest)
+        else:
+            _fast_move(path, dest)
+            _move_cached_date(path, dest)
+            if log:
+                log.info("Moved {} → {}", path, dest)
+
+    # Single walk over target_folder/YYYY/YYYYMM: only digit folders are visited and month folders are not descended
+    # into (their subfolders are event or video folders)
+    with ExitStack() as stack:
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_concurrency)) if max_concurrency > 1 else None
+        for dirpath, dirnames, filenames in os.walk(target_folder):
+            depth = len(Path(dirpath).relative_to(target_folder).parts)
+            if depth < 2:
+                dirnames[:] = [d for d in dirnames if d.isdigit()]
+                continue
+            dirnames[:] = []
 
-                        if dry_run:
-                            if log:
-                                log.info(f"🧪 Would move {path} → {dest}")
-                        else:
-                            shutil.move(path, dest)
-                            if log:
-                                log.info(f"Moved {path} → {dest}")
+            if executor is None:
+                for filename in filenames:
+                    group_file(Path(dirpath, filename))
+                continue
 
-                        break  # one event per file
+            # Files of a month folder are processed concurrently, one folder at a time
+            futures = [executor.submit(group_file, Path(dirpath, filename)) for filename in filenames]
+            for future in as_completed(futures):
+                future.result()
 
     if log:
         log.info("Finished moving media to events subfolders!")
 
 
-def process_file(path: Path, target_folder: Path, log=None) -> bool:
+def process_file(
+    path: Path,
+    target_folder: Path,
+    log=None,
+    file_date: datetime.datetime | None = None,
+    st: os.stat_result | None = None,
+) -> bool:
     """Organize file by moving/copying it to the appropriate folder based on its date and type.
 
     Parameters
@@ -281,6 +524,10 @@ def process_file(path: Path, target_folder: Path, log=None) -> bool:
         Root folder in which the media file will be moved.
     log : Logger, optional
         Logger object.
+    file_date : datetime.datetime, optional
+        Date of the file if already known (e.g. from `extract_date_only`), extracted from the file otherwise.
+    st : os.stat_result, optional
+        Status of the file, if already known (e.g. from an `os.DirEntry`), to avoid stat-ing it again.
 
     Returns
     -------
@@ -288,42 +535,49 @@ def process_file(path: Path, target_folder: Path, log=None) -> bool:
         True if file was moved/copied, False otherwise.
 
     """
-    file_date = extract_date(path, log=log)
+    # Get file extension (once), and skip unknown types before reading any metadata
+    ext = path.suffix.lower()
+    is_photo = ext in PHOTO_EXTS
+    if not is_photo and ext not in VIDEO_EXTS:
+        if log:
+            log.info("⚠️  Skipping (unknown type): {}", path.name)
+        return False
+
+    if file_date:
+        if st is not None:
+            # Date extracted by another process: remember it for the events grouping of the same run
+            _cache_date(path, st, file_date)
+    else:
+        file_date = extract_date(path, log=log, ext=ext, st=st)
     if not file_date:
         if log:
-            log.debug(f"⚠️  Skipping (no date): {path.name}")
+            log.debug("⚠️  Skipping (no date): {}", path.name)
         return False
 
     year, year_month, _ = get_year_month_day(file_date)
     if not year or not year_month:
         return False
 
-    # Get file extension
-    ext = path.suffix.lower()
-
     # Photo
-    if ext in PHOTO_EXTS:
+    if is_photo:
         dest_dir = target_folder / year / year_month
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(dest_dir)
         dest_path = dest_dir / path.name
 
-        shutil.move(path, dest_path)
+        _fast_move(path, dest_path)
+        _move_cached_date(path, dest_path)
         if log:
-            log.info(f"📷 Moved photo → {dest_path}")
+            log.debug("📷 Moved photo → {}", dest_path)
         return True
 
     # Video
-    elif ext in VIDEO_EXTS:
+    else:
         dest_dir = target_folder / year / year_month / "video"
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(dest_dir)
         dest_path = dest_dir / path.name
 
-        shutil.move(path, dest_path)
+        _fast_move(path, dest_path)
+        _move_cached_date(path, dest_path)
         if log:
-            log.info(f"🎥 Moved video → {dest_path}")
+            log.debug("🎥 Moved video → {}", dest_path)
         return True
-
-    else:
-        if log:
-            log.info(f"⚠️  Skipping (unknown type): {path.name}")
-        return False
@@ -1,14 +1,62 @@
 """Common Utils."""
 
-from datetime import datetime
+import hashlib
+import json
+import os
+from datetime import date
 from pathlib import Path
 
-import yaml
+# Parsed events files are cached here, so unchanged files are not parsed again on every invocation
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "media_archive_tools"
+# Version of the cached events format, to be bumped whenever the output of `_parse_events` changes
+CACHE_VERSION = 4
+
+
+def _parse_yyyymmdd(value: int | str) -> date:
+    """Convert a YYYYMMDD integer (or string) into a date, with integer math instead of `datetime.strptime`."""
+    n = int(value)
+    return date(n // 10000, n // 100 % 100, n % 100)
+
+
+def _parse_events(path: Path) -> list[dict]:
+    """Parse events and their date ranges from a YAML file, sorted by start date."""
+    # Imported lazily: PyYAML takes ~40ms to import, which every CLI command would otherwise pay at startup
+    # even though only the events grouping reads YAML.
+    import yaml
+
+    try:
+        # libyaml bindings, much faster than the pure Python loader
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    with path.open() as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    events: list[dict] = []
+    for e in data.get("events", []):
+        start = _parse_yyyymmdd(e["start"])
+        events.append(
+            {
+                "name": e["name"],
+                "start": start,
+                "end": _parse_yyyymmdd(e["end"]),
+                # Event folder relative to the target folder: YYYY/YYYYMM/name
+                "root_parts": (str(start.year), start.strftime("%Y%m"), e["name"]),
+            }
+        )
+
+    events.sort(key=lambda e: e["start"])
+    return events
 
 
 def load_events(path: Path) -> list[dict]:
     """Load events from a YAML file and parse their date ranges.
 
+    The parsed events are cached as JSON in `CACHE_DIR` and reused for as long as the YAML file is unchanged
+    (same modification time and size), which skips importing and running the YAML parser. Any error while reading
+    the cache is treated as a cache miss.
+
     Parameters
     ----------
     path : Path
@@ -17,20 +65,44 @@ def load_events(path: Path) -> list[dict]:
     Returns
     -------
     list of dict
-        List of event dictionaries with 'name', 'start', and 'end' keys.
+        List of event dictionaries with 'name', 'start', 'end' and 'root_parts' (event folder path components
+        relative to the target folder) keys, sorted by start date.
 
     """
-    with path.open() as f:
-        data = yaml.safe_load(f)
+    st = path.stat()
+    key = [CACHE_VERSION, st.st_mtime_ns, st.st_size]
+    cache_file = CACHE_DIR / f"events-{hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:16]}.json"
 
-    events: list[dict] = []
-    for e in data.get("events", []):
-        events.append(
-            {
-                "name": e["name"],
-                "start": datetime.strptime(str(e["start"]), "%Y%m%d").date(),
-                "end": datetime.strptime(str(e["end"]), "%Y%m%d").date(),
-            }
-        )
+    try:
+        with cache_file.open() as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            return [
+                {
+                    "name": e["name"],
+                    "start": date.fromisoformat(e["start"]),
+                    "end": date.fromisoformat(e["end"]),
+                    "root_parts": tuple(e["root_parts"]),
+                }
+                for e in cached["events"]
+            ]
+    except Exception:
+        # Missing, stale or unreadable cache: parse the YAML file
+        pass
+
+    events = _parse_events(path)
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with cache_file.open("w") as f:
+            json.dump(
+                {
+                    "key": key,
+                    "events": [{**e, "start": e["start"].isoformat(), "end": e["end"].isoformat()} for e in events],
+                },
+                f,
+            )
+    except OSError:
+        pass
 
     return events
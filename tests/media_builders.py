@@ -0,0 +1,87 @@
+"""Builders of minimal media files for the tests."""
+
+import datetime
+import struct
+
+from media_archive.exif_fast import TAG_EXIF_IFD
+from media_archive.mp4_fast import MP4_EPOCH
+
+TYPE_ASCII = 2
+TYPE_LONG = 4
+
+
+def make_tiff(endian: str, ifd0: dict[int, bytes], exif_ifd: dict[int, bytes] | None = None) -> bytes:
+    """Build a TIFF structure with ASCII tags in IFD0 and, optionally, in an Exif sub-IFD."""
+    order = b"II" if endian == "<" else b"MM"
+    ifd0_offset = 8
+    ifd0_size = 2 + 12 * (len(ifd0) + (exif_ifd is not None)) + 4
+    exif_offset = ifd0_offset + ifd0_size
+    exif_size = 2 + 12 * len(exif_ifd) + 4 if exif_ifd is not None else 0
+    data_offset = exif_offset + exif_size
+
+    data = b""
+
+    def ifd(tags: dict[int, bytes], extra: list[tuple[int, int, int, int]]) -> bytes:
+        nonlocal data
+        entries = []
+        for tag, value in tags.items():
+            entries.append((tag, TYPE_ASCII, len(value), data_offset + len(data)))
+            data += value
+        entries += extra
+        out = struct.pack(endian + "H", len(entries))
+        for entry in sorted(entries):
+            out += struct.pack(endian + "HHII", *entry)
+        return out + struct.pack(endian + "I", 0)
+
+    pointer = [(TAG_EXIF_IFD, TYPE_LONG, 1, exif_offset)] if exif_ifd is not None else []
+    tiff = order + struct.pack(endian + "HI", 42, ifd0_offset) + ifd(ifd0, pointer)
+    if exif_ifd is not None:
+        tiff += ifd(exif_ifd, [])
+    return tiff + data
+
+
+def make_jpeg(tiff: bytes | None, padding: int = 0) -> bytes:
+    """Build a minimal JPEG: SOI, an APP0 segment, the EXIF APP1 segment (if any) and the start of scan."""
+    jpeg = b"\xff\xd8"
+    jpeg += b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+    # Padding segments (e.g. embedded thumbnails or ICC profiles) before the EXIF segment
+    while padding > 0:
+        size = min(padding, 0xFFFF - 2)
+        jpeg += b"\xff\xe2" + struct.pack(">H", size + 2) + b"\x00" * size
+        padding -= size
+    if tiff is not None:
+        payload = b"Exif\x00\x00" + tiff
+        jpeg += b"\xff\xe1" + struct.pack(">H", len(payload) + 2) + payload
+    return jpeg + b"\xff\xda" + b"\x00" * 64 + b"\xff\xd9"
+
+
+def atom(kind: bytes, payload: bytes) -> bytes:
+    """Build an atom with a 32-bit size."""
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def mvhd(creation_time: int, version: int = 0) -> bytes:
+    """Build a movie header atom (version 0 uses 32-bit times, version 1 64-bit times)."""
+    if version == 1:
+        times = struct.pack(">QQIQ", creation_time, creation_time, 1000, 0)
+    else:
+        times = struct.pack(">IIII", creation_time, creation_time, 1000, 0)
+    return atom(b"mvhd", bytes([version, 0, 0, 0]) + times + b"\x00" * 80)
+
+
+def moov(creation_time: int, version: int = 0) -> bytes:
+    """Build a moov atom containing a movie header."""
+    return atom(b"moov", mvhd(creation_time, version))
+
+
+FTYP = atom(b"ftyp", b"isom\x00\x00\x02\x00isomiso2mp41")
+
+
+def mp4_time(created: datetime.datetime) -> int:
+    """Convert a date into a MP4 timestamp (seconds since 1904)."""
+    return int((created - MP4_EPOCH).total_seconds())
+
+
+def make_mp4(created: datetime.datetime, version: int = 0) -> bytes:
+    """Build a minimal MP4 file whose movie header holds the given creation date."""
+    return FTYP + moov(mp4_time(created), version)
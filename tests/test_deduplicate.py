@@ -0,0 +1,125 @@
+"""Tests for the photo collection and the duplicate finder."""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from media_archive import deduplicate
+from media_archive.deduplicate import PARTIAL_HASH_BYTES, collect_files, find_duplicates, partial_hash
+
+N = PARTIAL_HASH_BYTES
+
+
+class RecordingLog:
+    """Logger recording the error messages."""
+
+    def __init__(self):
+        """Start with no recorded error."""
+        self.errors = []
+
+    def error(self, message, *args):
+        """Record an error message."""
+        self.errors.append(message.format(*args))
+
+
+def write(path, content: bytes) -> str:
+    """Write a file and return its path as a string."""
+    path.write_bytes(content)
+    return str(path)
+
+
+def run(paths, sizes=None):
+    """Find the duplicates among the given files, as sorted lists of file names."""
+    log = RecordingLog()
+    if sizes is None:
+        sizes = [os.path.getsize(p) for p in paths]
+    duplicates = find_duplicates(paths, sizes, log)
+    return sorted(sorted(f.name for f in files) for files in duplicates.values()), log
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (N // 2, lambda c: c),
+        (N, lambda c: c),
+        (N + N // 2, lambda c: c),
+        (2 * N, lambda c: c),
+        (3 * N, lambda c: c[:N] + c[-N:]),
+    ],
+    ids=["smaller-than-n", "n", "between-n-and-2n", "2n", "larger-than-2n"],
+)
+def test_partial_hash_bytes(tmp_path, size, expected):
+    """The partial hash covers the head and tail of the file, each byte once when they overlap."""
+    content = bytes(i % 251 for i in range(size))
+    path = write(tmp_path / "a.jpg", content)
+    assert partial_hash(path) == hashlib.sha256(expected(content)).hexdigest()
+
+
+def test_small_files_skip_partial_hash(tmp_path, monkeypatch):
+    """Files small enough to be fully read by the partial hash go straight to the full hash."""
+    hashed = []
+
+    def recording_partial_hash(path, n=N):
+        hashed.append(path)
+        return partial_hash(path, n)
+
+    # Hash in threads, so that the patched function is the one called
+    monkeypatch.setattr(deduplicate, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(deduplicate, "partial_hash", recording_partial_hash)
+    small = [write(tmp_path / f"small{i}.jpg", b"s" * 2 * N) for i in range(2)]
+    large = [write(tmp_path / f"large{i}.jpg", b"l" * (2 * N + 1)) for i in range(2)]
+
+    groups, _ = run(small + large)
+    assert groups == [["large0.jpg", "large1.jpg"], ["small0.jpg", "small1.jpg"]]
+    assert sorted(hashed) == sorted(large)
+
+
+def test_different_middle_rejected_by_full_hash(tmp_path):
+    """Same-size files with the same head and tail but a different middle are not duplicates."""
+    head, tail = b"h" * N, b"t" * N
+    paths = [
+        write(tmp_path / "a.jpg", head + b"x" * N + tail),
+        write(tmp_path / "b.jpg", head + b"y" * N + tail),
+        write(tmp_path / "c.jpg", head + b"y" * N + tail),
+    ]
+    assert partial_hash(paths[0]) == partial_hash(paths[1])
+
+    groups, log = run(paths)
+    assert groups == [["b.jpg", "c.jpg"]]
+    assert not log.errors
+
+
+def test_unreadable_file_is_logged(tmp_path):
+    """A file failing to hash (here removed after being scanned) is logged and does not abort the search."""
+    content = b"d" * 3 * N
+    paths = [write(tmp_path / name, content) for name in ("a.jpg", "b.jpg", "missing.jpg")]
+    sizes = [os.path.getsize(p) for p in paths]
+    os.unlink(paths[2])
+
+    groups, log = run(paths, sizes)
+    assert groups == [["a.jpg", "b.jpg"]]
+    assert len(log.errors) == 1 and "missing.jpg" in log.errors[0]
+
+
+def test_collect_files(tmp_path):
+    """Photos are collected from nested folders, without following folder symlinks nor broken links."""
+    root = tmp_path / "root"
+    (root / "sub" / "deep").mkdir(parents=True)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    write(outside / "linked.jpg", b"l")
+    expected = [
+        write(root / "a.JPG", b"a"),
+        write(root / "sub" / "b.jpeg", b"bb"),
+        write(root / "sub" / "deep" / "c.Png", b"ccc"),
+    ]
+    write(root / "notes.txt", b"text")
+    write(root / "sub" / "jpg", b"no extension")
+    (root / "link").symlink_to(outside, target_is_directory=True)
+    (root / "broken.jpg").symlink_to(tmp_path / "missing.jpg")
+
+    paths, sizes = collect_files(root)
+    assert sorted(paths) == sorted(expected)
+    assert sizes == [os.stat(p).st_size for p in paths]
@@ -0,0 +1,107 @@
+"""Tests for the JPEG EXIF date reader."""
+
+import datetime
+
+import pytest
+from media_builders import make_jpeg, make_tiff
+
+from media_archive.exif_fast import (
+    HEADER_SIZE,
+    TAG_DATETIME,
+    TAG_DATETIME_DIGITIZED,
+    TAG_DATETIME_ORIGINAL,
+    parse_exif_datetime,
+    read_datetime_original,
+)
+
+ORIGINAL = b"2020:01:02 03:04:05\x00"
+DIGITIZED = b"2019:06:07 08:09:10\x00"
+MODIFIED = b"2021:05:06 07:08:09\x00"
+
+
+@pytest.mark.parametrize("endian", ["<", ">"])
+def test_prefers_datetime_original(tmp_path, endian):
+    """DateTimeOriginal from the Exif sub-IFD wins over DateTimeDigitized and the IFD0 DateTime."""
+    path = tmp_path / "photo.jpg"
+    tiff = make_tiff(
+        endian, {TAG_DATETIME: MODIFIED}, {TAG_DATETIME_ORIGINAL: ORIGINAL, TAG_DATETIME_DIGITIZED: DIGITIZED}
+    )
+    path.write_bytes(make_jpeg(tiff))
+    assert read_datetime_original(path) == datetime.datetime(2020, 1, 2, 3, 4, 5)
+
+
+def test_falls_back_to_datetime_digitized(tmp_path):
+    """DateTimeDigitized is used when DateTimeOriginal is missing."""
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(make_jpeg(make_tiff("<", {TAG_DATETIME: MODIFIED}, {TAG_DATETIME_DIGITIZED: DIGITIZED})))
+    assert read_datetime_original(path) == datetime.datetime(2019, 6, 7, 8, 9, 10)
+
+
+def test_falls_back_to_ifd0_datetime(tmp_path):
+    """The IFD0 DateTime is used without an Exif sub-IFD."""
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(make_jpeg(make_tiff(">", {TAG_DATETIME: MODIFIED})))
+    assert read_datetime_original(path) == datetime.datetime(2021, 5, 6, 7, 8, 9)
+
+
+def test_skips_blank_timestamp(tmp_path):
+    """A blank DateTimeOriginal is skipped in favour of the next tag."""
+    path = tmp_path / "photo.jpg"
+    tiff = make_tiff("<", {TAG_DATETIME: MODIFIED}, {TAG_DATETIME_ORIGINAL: b"    :  :     :  :  \x00"})
+    path.write_bytes(make_jpeg(tiff))
+    assert read_datetime_original(path) == datetime.datetime(2021, 5, 6, 7, 8, 9)
+
+
+def test_skips_segments_before_exif(tmp_path):
+    """Segments preceding the EXIF segment are skipped over."""
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(make_jpeg(make_tiff("<", {TAG_DATETIME: MODIFIED}), padding=30_000))
+    assert read_datetime_original(path) == datetime.datetime(2021, 5, 6, 7, 8, 9)
+
+
+def test_exif_beyond_header(tmp_path):
+    """EXIF data located after the mapped header is not read."""
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(make_jpeg(make_tiff("<", {TAG_DATETIME: MODIFIED}), padding=HEADER_SIZE))
+    assert read_datetime_original(path) is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"\x89PNG\r\n\x1a\n" + b"\x00" * 64,
+        make_jpeg(None),
+        make_jpeg(b"XX\x00\x2a\x00\x00\x00\x08"),
+    ],
+    ids=["empty", "not-jpeg", "no-exif", "bad-byte-order"],
+)
+def test_no_date(tmp_path, content):
+    """Files without a readable EXIF date return None."""
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(content)
+    assert read_datetime_original(path) is None
+
+
+def test_truncated_file(tmp_path):
+    """A file truncated in the middle of the EXIF data returns None."""
+    path = tmp_path / "photo.jpg"
+    jpeg = make_jpeg(make_tiff("<", {TAG_DATETIME: MODIFIED}, {TAG_DATETIME_ORIGINAL: ORIGINAL}))
+    path.write_bytes(jpeg[: jpeg.index(b"Exif") + 30])
+    assert read_datetime_original(path) is None
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2020:01:02 03:04:05", datetime.datetime(2020, 1, 2, 3, 4, 5)),
+        (b"2020:01:02 03:04:05", datetime.datetime(2020, 1, 2, 3, 4, 5)),
+        ("    :  :     :  :  ", None),
+        ("2020:13:02 03:04:05", None),
+        ("2020:01:02", None),
+        ("", None),
+    ],
+)
+def test_parse_exif_datetime(value, expected):
+    """EXIF timestamps are parsed by position, invalid ones return None."""
+    assert parse_exif_datetime(value) == expected
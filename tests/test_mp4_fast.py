@@ -0,0 +1,57 @@
+"""Tests for the MP4/MOV movie header date reader."""
+
+import datetime
+import struct
+
+import pytest
+from media_builders import FTYP, atom, moov, mp4_time, mvhd
+
+from media_archive.mp4_fast import read_mvhd_creation_time
+
+CREATED = datetime.datetime(2023, 7, 8, 9, 10, 11)
+SECONDS = mp4_time(CREATED)
+
+
+@pytest.mark.parametrize("version", [0, 1])
+def test_moov_before_mdat(tmp_path, version):
+    """Both movie header versions are read when moov precedes the media data."""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(FTYP + moov(SECONDS, version) + atom(b"mdat", b"\x00" * 1024))
+    assert read_mvhd_creation_time(path) == CREATED
+
+
+def test_moov_after_large_mdat(tmp_path):
+    """A 64-bit sized mdat atom is skipped over to reach moov."""
+    path = tmp_path / "video.mp4"
+    data = b"\x00" * 1024
+    mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + len(data)) + data
+    path.write_bytes(FTYP + mdat + moov(SECONDS))
+    assert read_mvhd_creation_time(path) == CREATED
+
+
+def test_moov_extending_to_end_of_file(tmp_path):
+    """A moov atom with a size of 0 extends to the end of the file."""
+    path = tmp_path / "video.mov"
+    path.write_bytes(FTYP + struct.pack(">I4s", 0, b"moov") + mvhd(SECONDS))
+    assert read_mvhd_creation_time(path) == CREATED
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"\x00" * 3,
+        FTYP + atom(b"mdat", b"\x00" * 64),
+        FTYP + moov(creation_time=0),
+        FTYP + atom(b"moov", atom(b"trak", b"\x00" * 16)),
+        FTYP + moov(SECONDS)[:20],
+        FTYP + struct.pack(">I4s", 4, b"junk") + moov(SECONDS),
+        FTYP + moov(creation_time=2**64 - 1, version=1),
+    ],
+    ids=["empty", "garbage", "no-moov", "zero-time", "no-mvhd", "truncated", "bad-size", "overflow"],
+)
+def test_no_date(tmp_path, content):
+    """Files without a usable creation time return None."""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(content)
+    assert read_mvhd_creation_time(path) is None
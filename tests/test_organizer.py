@@ -0,0 +1,147 @@
+"""Tests for the media organizer."""
+
+import datetime
+import os
+import shutil
+
+import pytest
+from media_builders import FTYP, make_mp4, moov
+
+from media_archive import organizer, utils
+
+
+@pytest.fixture(autouse=True)
+def clear_date_cache():
+    """Start each test with an empty date cache."""
+    organizer._DATE_CACHE.clear()
+    yield
+    organizer._DATE_CACHE.clear()
+
+
+def test_same_name_size_and_mtime(tmp_path):
+    """Files sharing their name, size and mtime in different folders keep their own date."""
+    first = datetime.datetime(2020, 1, 2, 3, 4, 5)
+    second = datetime.datetime(2021, 6, 7, 8, 9, 10)
+    paths = []
+    for folder, created in (("a", first), ("b", second)):
+        path = tmp_path / folder / "clip.mp4"
+        path.parent.mkdir()
+        path.write_bytes(make_mp4(created))
+        os.utime(path, ns=(0, 1_600_000_000_000_000_000))
+        paths.append(path)
+
+    assert organizer.extract_date(paths[0]) == first
+    assert organizer.extract_date(paths[1]) == second
+
+
+def test_cached_date_follows_moved_file(tmp_path, monkeypatch):
+    """The date of an organized file is read from the cache at its new location."""
+    created = datetime.datetime(2020, 1, 2, 3, 4, 5)
+    path = tmp_path / "in" / "clip.mp4"
+    path.parent.mkdir()
+    path.write_bytes(make_mp4(created))
+    target = tmp_path / "out"
+
+    assert organizer.process_file(path, target)
+    dest = target / "2020" / "202001" / "video" / "clip.mp4"
+    assert dest.exists()
+
+    monkeypatch.setattr(organizer, "_extract_date_from_metadata", lambda *args: pytest.fail("metadata read again"))
+    assert organizer.extract_date(dest) == created
+    assert str(path) not in organizer._DATE_CACHE
+
+
+def test_cached_date_invalidated_on_change(tmp_path):
+    """A cached date is not used once the file is modified."""
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(make_mp4(datetime.datetime(2020, 1, 2, 3, 4, 5)))
+    organizer.extract_date(path)
+
+    path.write_bytes(make_mp4(datetime.datetime(2022, 3, 4, 5, 6, 7)) + bytes(8))
+    assert organizer.extract_date(path) == datetime.datetime(2022, 3, 4, 5, 6, 7)
+
+
+EVENTS = """events:
+  - name: summer
+    start: 20230701
+    end: 20230831
+  - name: wedding
+    start: 20230715
+    end: 20230716
+  - name: trip
+    start: 20230720
+    end: 20230722
+  - name: long
+    start: 20230601
+    end: 20230605
+  - name: short
+    start: 20230601
+    end: 20230603
+"""
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("IMG_20230715.jpg", "2023/202307/wedding"),
+        ("IMG_20230721.jpg", "2023/202307/trip"),
+        ("IMG_20230725.jpg", "2023/202307/summer"),
+        ("IMG_20230910.jpg", "2023/202309"),
+        ("IMG_20230602.jpg", "2023/202306/short"),
+        ("IMG_20230604.jpg", "2023/202306/long"),
+    ],
+    ids=["nested", "nested-later", "walk-back", "no-event", "equal-starts", "equal-starts-walk-back"],
+)
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_group_by_events(tmp_path, monkeypatch, name, expected, max_concurrency):
+    """Files go to the latest starting event covering their date, the last listed one on equal starts."""
+    monkeypatch.setattr(utils, "CACHE_DIR", tmp_path / "cache")
+    events_file = tmp_path / "events.yaml"
+    events_file.write_text(EVENTS)
+    target = tmp_path / "target"
+    path = target / name[4:8] / name[4:10] / name
+    path.parent.mkdir(parents=True)
+    path.touch()
+
+    organizer.group_by_events(target, events_file, dry_run=False, max_concurrency=max_concurrency)
+    assert [p.relative_to(target).as_posix() for p in target.rglob("*.jpg")] == [f"{expected}/{name}"]
+
+
+def test_group_by_events_serial(tmp_path, monkeypatch):
+    """Files are grouped without a thread pool when max_concurrency is 1."""
+    monkeypatch.setattr(utils, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(organizer, "ThreadPoolExecutor", lambda **kwargs: pytest.fail("thread pool created"))
+    events_file = tmp_path / "events.yaml"
+    events_file.write_text(EVENTS)
+    path = tmp_path / "target" / "2023" / "202307" / "IMG_20230715.jpg"
+    path.parent.mkdir(parents=True)
+    path.touch()
+
+    organizer.group_by_events(tmp_path / "target", events_file, dry_run=False)
+    assert (tmp_path / "target" / "2023" / "202307" / "wedding" / "IMG_20230715.jpg").exists()
+
+
+def test_process_file_after_target_removed(tmp_path):
+    """Files are moved again after the destination folders created by a previous run were removed."""
+    target = tmp_path / "target"
+    for _ in range(2):
+        path = tmp_path / "IMG_20230715.jpg"
+        path.touch()
+        assert organizer.process_file(path, target)
+        assert (target / "2023" / "202307" / "IMG_20230715.jpg").exists()
+        shutil.rmtree(target)
+
+
+def test_overflow_falls_back_to_ffprobe(tmp_path, monkeypatch):
+    """An out of range creation time in the movie header falls back to ffprobe."""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(FTYP + moov(creation_time=2**64 - 1, version=1))
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return organizer.subprocess.CompletedProcess(cmd, 0, stdout="2023-07-08T09:10:11.000000Z\n")
+
+    monkeypatch.setattr(organizer.subprocess, "run", run)
+    assert organizer.get_date_from_video(path) == datetime.datetime(2023, 7, 8, 9, 10, 11)
+    assert calls and calls[0][-1] == str(path)
@@ -0,0 +1,94 @@
+"""Tests for the events loading."""
+
+import os
+from datetime import date
+
+import pytest
+
+from media_archive import utils
+from media_archive.utils import load_events
+
+EVENTS = """events:
+  - name: summer
+    start: 20230701
+    end: 20230831
+  - name: wedding
+    start: 20230715
+    end: 20230716
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Cache the parsed events in a temporary folder."""
+    monkeypatch.setattr(utils, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def events_file(tmp_path):
+    """Write an events file."""
+    path = tmp_path / "events.yaml"
+    path.write_text(EVENTS)
+    return path
+
+
+def no_parse(path):
+    """Fail when the events file is parsed instead of read from the cache."""
+    pytest.fail("events parsed again")
+
+
+def test_parse_events(events_file):
+    """Events are parsed, sorted by start date and given their folder path."""
+    events = load_events(events_file)
+    assert events == [
+        {
+            "name": "summer",
+            "start": date(2023, 7, 1),
+            "end": date(2023, 8, 31),
+            "root_parts": ("2023", "202307", "summer"),
+        },
+        {
+            "name": "wedding",
+            "start": date(2023, 7, 15),
+            "end": date(2023, 7, 16),
+            "root_parts": ("2023", "202307", "wedding"),
+        },
+    ]
+
+
+def test_cache_hit(events_file, monkeypatch):
+    """An unchanged events file is read from the cache."""
+    events = load_events(events_file)
+    monkeypatch.setattr(utils, "_parse_events", no_parse)
+    assert load_events(events_file) == events
+
+
+def test_edit_invalidates_cache(events_file):
+    """Editing the events file invalidates the cache."""
+    load_events(events_file)
+    st = events_file.stat()
+    events_file.write_text(EVENTS.replace("wedding", "party"))
+    os.utime(events_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert [e["name"] for e in load_events(events_file)] == ["summer", "party"]
+
+
+def test_cache_version_bump_ignores_cache(events_file, monkeypatch):
+    """A cache written by another version of the cache format is not used."""
+    load_events(events_file)
+    monkeypatch.setattr(utils, "CACHE_VERSION", utils.CACHE_VERSION + 1)
+    parsed = []
+    parse_events = utils._parse_events
+    monkeypatch.setattr(utils, "_parse_events", lambda path: parsed.append(path) or parse_events(path))
+    load_events(events_file)
+    assert parsed == [events_file]
+
+
+@pytest.mark.parametrize("content", ["", "not json", '{"key": null}', "[]"])
+def test_corrupt_cache_is_a_miss(events_file, cache_dir, content):
+    """An unreadable cache file is treated as a cache miss and rewritten."""
+    events = load_events(events_file)
+    (cache_file,) = cache_dir.iterdir()
+    cache_file.write_text(content)
+    assert load_events(events_file) == events
+    assert cache_file.read_text() != content